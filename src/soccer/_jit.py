@@ -0,0 +1,31 @@
+# src/soccer/_jit.py
+
+"""Optional, lazily loaded Numba compilation for the package's loop kernels.
+
+Numba is imported (and a kernel compiled or loaded from its on-disk cache)
+only the first time a caller asks for it, i.e. once an input is large
+enough to use the kernel. Small runs never pay the Numba import.
+"""
+
+
+from __future__ import annotations
+from functools import lru_cache
+from typing import Callable, Optional
+
+
+@lru_cache(maxsize=None)
+def compiled(fn: Callable) -> Optional[Callable]:
+    """Return `fn` compiled with ``numba.njit(cache=True)``, or None without Numba.
+
+    Args:
+        fn: Module-level function written in the NumPy subset Numba supports.
+
+    Returns:
+        The compiled dispatcher (memoized per function), or None when Numba
+        is not installed so the caller falls back to its NumPy/Python path.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(cache=True)(fn)
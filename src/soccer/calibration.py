@@ -15,25 +15,61 @@ This module exposes two helpers used to evaluate probability forecasts:
   their difference (``gap = emp_rate - mean_p``). This is useful for building
   reliability diagrams / calibration tables.
 
-Both functions treat inputs as floats and do not align by index; they operate
-positionally. Callers should ensure ``y_true`` and ``p`` correspond row-for-row.
+Both functions accept pandas Series or NumPy arrays, treat inputs as floats and
+do not align by index; they operate positionally. Callers should ensure ``y_true`` and ``p`` correspond row-for-row.
 """
 
 
 from __future__ import annotations
 import numpy as np
 import pandas as pd
+from numpy.typing import ArrayLike
+from ._jit import compiled
 
 
+# Below this size the bincount path is already fast; skip the JIT dispatch.
+_NUMBA_MIN_SIZE = 100_000
 
-def brier_score(y_true: pd.Series, p: pd.Series) -> float:
+
+def _reliability_loop(idx, p, y, bins):
+    """Accumulate per-bin count, sum of p, and sum of y in one pass (compiled via `compiled`)."""
+    n = np.zeros(bins, np.int64)
+    sp = np.zeros(bins, np.float64)
+    sy = np.zeros(bins, np.float64)
+    for i in range(idx.size):
+        b = idx[i]
+        n[b] += 1
+        sp[b] += p[i]
+        sy[b] += y[i]
+    return n, sp, sy
+
+
+def _as_float_array(x: ArrayLike, dtype: np.dtype = np.float64) -> np.ndarray:
+    """Return ``x`` as a float ndarray of ``dtype``, without copying when it already is one.
+
+    NumPy arrays of the right dtype and numeric Series are returned as views;
+    anything else (lists, bool/int arrays, nullable Series) is converted, with
+    missing values mapped to NaN.
+    """
+    if isinstance(x, np.ndarray):
+        return x if x.dtype == dtype else x.astype(dtype)
+    if isinstance(x, pd.Series):
+        return x.to_numpy(dtype=dtype, na_value=np.nan)
+    return np.asarray(x, dtype=dtype)
+
+
+
+def brier_score(y_true: ArrayLike, p: ArrayLike, dtype: np.dtype = np.float64) -> float:
     """Compute the Brier score: mean((p - y)^2).
 
     Parameters: 
-        y_true : pd.Series
+        y_true : pd.Series or np.ndarray
             Binary outcomes encoded as 0/1 (truthy values are coerced to float).
-        p : pd.Series
+        p : pd.Series or np.ndarray
             Predicted probabilities for the positive class in [0, 1] (coerced to float).
+        dtype : np.dtype, default np.float64
+            Working precision. ``np.float32`` halves the memory traffic on long
+            inputs; the score itself does not need FP64 precision.
 
     Returns:
         float
@@ -43,13 +79,21 @@ def brier_score(y_true: pd.Series, p: pd.Series) -> float:
         ValueError
             If the inputs have different lengths.
     """
-    y = y_true.astype(float).to_numpy()
-    q = p.astype(float).to_numpy()
-    return float(np.mean((q - y) ** 2))
+    if len(y_true) != len(p):
+        raise ValueError(f"Length mismatch: y_true={len(y_true)}, p={len(p)}")
 
+    y = _as_float_array(y_true, dtype)
+    q = _as_float_array(p, dtype)
 
+    # Fused subtract + square into a single scratch buffer (no extra temporaries).
+    diff = np.empty_like(q)
+    np.subtract(q, y, out=diff)
+    np.multiply(diff, diff, out=diff)
+    return float(diff.mean(dtype=np.float64))
 
-def reliability_table(y_true: pd.Series, p: pd.Series, bins: int = 10) -> pd.DataFrame:
+
+
+def reliability_table(y_true: ArrayLike, p: ArrayLike, bins: int = 10) -> pd.DataFrame:
     """Build a reliability (calibration) table over equal-width probability bins.
 
     The probability range [0, 1] is divided into ``bins`` equal-width intervals.
@@ -61,9 +105,9 @@ def reliability_table(y_true: pd.Series, p: pd.Series, bins: int = 10) -> pd.Dat
     - ``gap``:     ``emp_rate - mean_p`` (positive → under-confident; negative → over-confident)
 
     Parameters:
-        y_true : pd.Series
+        y_true : pd.Series or np.ndarray
             Binary outcomes encoded as 0/1 (will be coerced to float).
-        p : pd.Series
+        p : pd.Series or np.ndarray
             Predicted probabilities in [0, 1] (will be coerced to float).
         bins : int, default 10
             Number of equal-width bins to create across [0, 1].
@@ -73,23 +117,58 @@ def reliability_table(y_true: pd.Series, p: pd.Series, bins: int = 10) -> pd.Dat
             A DataFrame with columns ``['bin', 'n', 'mean_p', 'emp_rate', 'gap']``.
             ``bin`` is a pandas ``Interval`` (Categorical with ordered intervals).
             Empty bins are retained (``n == 0``) to make plotting consistent.
+            Probabilities that are NaN or outside [0, 1] are left out of every bin.
 
     Raises:
         ValueError
             If inputs have different lengths or ``bins < 1``.
     """
 
-    # Equal-width edges across [0, 1].
-    edges = np.linspace(0.0, 1.0, bins + 1)
+    if len(y_true) != len(p):
+        raise ValueError(f"Length mismatch: y_true={len(y_true)}, p={len(p)}")
+    if bins < 1:
+        raise ValueError(f"bins must be >= 1, got {bins}")
 
-    # Assign each probability to a bin. The first bin includes 0.0.
-    bucket = pd.cut(p, edges, include_lowest=True, right=True)
+    p_arr = _as_float_array(p)
+    y_arr = _as_float_array(y_true)
 
-    # Group by the categorical Interval bin. Use observed=False to keep empty bins.
-    g = pd.DataFrame({"y": y_true, "p": p, "bin": bucket}).groupby("bin", dropna=False)
+    # Missing and out-of-range probabilities fall in no bin (as with pd.cut);
+    # only filter (and copy) when there is something to drop.
+    valid = np.isfinite(p_arr) & (p_arr >= 0.0) & (p_arr <= 1.0)
+    if not valid.all():
+        p_arr = p_arr[valid]
+        y_arr = y_arr[valid]
+
+    # Equal-width edges across [0, 1].
+    edges = np.linspace(0.0, 1.0, bins + 1)
 
-    # Aggregate per bin.
-    out = g.agg(n=("y", "size"), mean_p=("p", "mean"), emp_rate=("y", "mean")).reset_index()
+    # Integer bin index per probability, right-closed like ``pd.cut(right=True)``;
+    # clipping folds 0.0 into the first bin (``include_lowest=True``).
+    idx = np.clip(np.searchsorted(edges, p_arr, side="left") - 1, 0, bins - 1)
+
+    # Per-bin sums; every bin is kept, including empty ones (n == 0).
+    kernel = compiled(_reliability_loop) if idx.size >= _NUMBA_MIN_SIZE else None
+    if kernel is not None:
+        # Large inputs with Numba installed: one fused pass instead of three bincounts.
+        n, sum_p, sum_y = kernel(idx, p_arr, y_arr, bins)
+    else:
+        n = np.bincount(idx, minlength=bins)
+        sum_p = np.bincount(idx, weights=p_arr, minlength=bins)
+        sum_y = np.bincount(idx, weights=y_arr, minlength=bins)
+
+    # Per-bin means; NaN where the bin is empty.
+    denom = np.where(n == 0, 1, n)
+    mean_p = np.where(n == 0, np.nan, sum_p / denom)
+    emp_rate = np.where(n == 0, np.nan, sum_y / denom)
+
+    # Bin labels exactly as pd.cut builds them (rounded edges, widened first bin).
+    labels = pd.cut(edges[1:], edges, include_lowest=True, right=True).categories
+    out = pd.DataFrame({
+        "bin": pd.Categorical(labels, categories=labels, ordered=True),
+        "n": n,
+        "mean_p": mean_p,
+        "emp_rate": emp_rate,
+    })
 
     # Calibration gap: empirical rate minus mean predicted probability.
     out["gap"] = out["emp_rate"] - out["mean_p"]
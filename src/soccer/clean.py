@@ -20,12 +20,12 @@ Input expectations (selected columns):
     - goals_for, goals_against, player_1_goals, player_2_goals, shots_for, shots_against: int-like
 
 Post-conditions / invariants set by `normalize`:
-    - `result`: "W" or "L" (derived from `win_or_loss`)
+    - `result`: categorical "W" or "L" (derived from `win_or_loss`)
     - Numerics are cast to nullable integers (pandas "Int64")
     - `ot`: nullable boolean (True/False/<NA>)
     - `date`: pandas datetime64[ns] (NaT on failure)
-    - `home_or_away`: "H" or "A" (others -> <NA>)
-    - `phase`: "Group" or "Knockout" (derived from `round`)
+    - `home_or_away`: categorical "A" or "H" (others -> <NA>)
+    - `phase`: categorical "Group" or "Knockout" (derived from `round`)
     - `goal_diff`: Int64 = goals_for - goals_against
 
 Example:
@@ -49,53 +49,27 @@ Example:
 
 
 from __future__ import annotations
+import numpy as np
 import pandas as pd
-from typing import Any, Optional
 
 
 # Accepted labels for knockout rounds (normalized to uppercase before comparison).
-_KNOCKOUT_ROUNDS = {"SF", "SEMIFINAL", "SEMI-FINAL", "FINAL", "F"}
+_KNOCKOUT_ROUNDS = frozenset({"SF", "SEMIFINAL", "SEMI-FINAL", "FINAL", "F"})
 
 
 # Sets for normalizing OT values to a nullable boolean.
-_TRUE_SET = {"YES", "Y", "1", "OT", "O/T", "T", "TRUE"}
-_FALSE_SET = {"NO", "N", "0", "F", "FALSE"}
+_TRUE_SET = frozenset({"YES", "Y", "1", "OT", "O/T", "T", "TRUE"})
+_FALSE_SET = frozenset({"NO", "N", "0", "F", "FALSE"})
 
+# Single lookup table so OT is resolved in one pass (unknown labels -> <NA>).
+_OT_MAP = {**{k: True for k in _TRUE_SET}, **{k: False for k in _FALSE_SET}}
 
-def _normalize_result(val: Any) -> Optional[str]:
-    """Map a free-form win/loss value to 'W' or 'L'.
 
-    Args:
-        val: Anything that might encode a win or loss (e.g., "W", "Win", "Loss").
-
-    Returns:
-        "W" or "L" if recognizable, else None (so the caller can decide what to do).
-    """
-
-    if pd.isna(val):
-        return None
-    s = str(val).strip().upper()
-    if s.startswith("W"):
-        return "W"
-    if s.startswith("L"):
-        return "L"
-    return None
-
-
-def _derive_phase(r: Any) -> str:
-    """Return 'Group' for non-knockout rounds, else 'Knockout'.
-
-    Args:
-        r: The raw round label.
-
-    Returns:
-        "Group" or "Knockout". Missing/unknown rounds default to "Group".
-    """
-    if pd.isna(r):
-        # default to Group stage game if round is missing
-        return "Group"
-    round = str(r).strip().upper()
-    return "Knockout" if round in _KNOCKOUT_ROUNDS else "Group"
+# Fixed categories for the low-cardinality derived columns (int8 codes instead of strings).
+# Listed in sorted order so grouped tables keep their alphabetical row order.
+_RESULT_DTYPE = pd.CategoricalDtype(["L", "W"])
+_HOME_AWAY_DTYPE = pd.CategoricalDtype(["A", "H"])
+_PHASE_DTYPE = pd.CategoricalDtype(["Group", "Knockout"])
 
 
 def normalize(df: pd.DataFrame) -> pd.DataFrame:
@@ -112,38 +86,39 @@ def normalize(df: pd.DataFrame) -> pd.DataFrame:
             - `date` as datetime64[ns]
     """
 
-    d = df.copy()
+    # Shallow copy: columns are replaced below, never written in place, so the
+    # caller's frame stays untouched without cloning every column up front.
+    d = df.copy(deep=False)
 
-    # --- RESULT: W/L, infer from goals if missing ---
-    d["result"] = d["win_or_loss"].apply(_normalize_result).astype("string")
+    # --- RESULT: W/L from the first letter (vectorized string ops, no per-row apply) ---
+    # Letters outside the categories are masked to <NA> before the categorical cast.
+    first = d["win_or_loss"].astype("string").str.strip().str.slice(0, 1).str.upper()
+    d["result"] = first.where(first.isin(_RESULT_DTYPE.categories)).astype(_RESULT_DTYPE)
 
     # --- NUMERIC CASTS (nullable Int64 to preserve missing) ---
     int_cols = ["tournament_no", "game_no", "goals_for", "goals_against", "player_1_goals", "player_2_goals", "shots_for", "shots_against"]
-    for c in int_cols:
-        # Convert text → numbers "5" → 5, if value is invalid, it becomes NaN instead of crashing
-        d[c] = pd.to_numeric(d[c], errors="coerce").astype("Int64")
+    # Convert text → numbers "5" → 5 in one batched call; invalid values become <NA> instead of crashing
+    d[int_cols] = d[int_cols].apply(pd.to_numeric, errors="coerce").astype("Int64")
     
     # --- OT -> nullable boolean
     s = d["ot"].astype("string").str.strip().str.upper()
-    map_t_or_f = pd.Series(pd.NA, index = d.index, dtype="boolean")
-    map_t_or_f[s.isin(_TRUE_SET)] = True
-    map_t_or_f[s.isin(_FALSE_SET)] = False
-    d["ot"] = map_t_or_f
+    d["ot"] = s.map(_OT_MAP).astype("boolean")
 
     # --- DATE ---
-    d["date"] = pd.to_datetime(d["date"], errors="coerce") #NaT on failure
+    d["date"] = pd.to_datetime(d["date"], format="ISO8601", errors="coerce") # fast ISO parser; NaT on failure
 
     # --- HOME/AWAY -> "H"/"A" ---
-    d["home_or_away"] = (
-        d["home_or_away"]
-        .astype("string").str.strip().str[0].str.upper()
-        .map({"H": "H", "A": "A"})
-        .astype("string")
-    )
+    first = d["home_or_away"].astype("string").str.strip().str.slice(0, 1).str.upper()
+    d["home_or_away"] = first.where(first.isin(_HOME_AWAY_DTYPE.categories)).astype(_HOME_AWAY_DTYPE)
 
     # --- DERIVED FIELDS ---
-    d["goal_diff"] = (d["goals_for"].astype("Int64") - d["goals_against"].astype("Int64")).astype("Int64")
-    d["phase"] = d["round"].apply(_derive_phase).astype("string")
+    # Both operands are already Int64, so the difference is Int64 with <NA> propagated.
+    d["goal_diff"] = d["goals_for"] - d["goals_against"]
+    knockout = d["round"].astype("string").str.strip().str.upper().isin(_KNOCKOUT_ROUNDS)
+    d["phase"] = pd.Series(
+        pd.Categorical.from_codes(knockout.to_numpy(dtype=np.int8), dtype=_PHASE_DTYPE),
+        index=d.index,
+    )
 
 
     return d
@@ -17,18 +17,77 @@ Usage (examples):
 
 
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import hashlib
 from pathlib import Path
-import pandas as pd
-from typing import Annotated
+from typing import Annotated, TYPE_CHECKING
 import typer
 
-from .io_csv import load_csv
-from .clean import normalize
-from .metrics import build_summary
-from .report import build_html_report
+# pandas and the pipeline modules are imported inside the functions that use
+# them, so `soccer --help` and shell completion don't pay the pandas import.
+if TYPE_CHECKING:
+    import pandas as pd
 
-from .elo import run_elo
-from .calibration import brier_score, reliability_table
+
+# Modules whose code shapes the cleaned frame; their source is part of the cache key.
+_CLEAN_SOURCES = ("io_csv.py", "clean.py")
+
+
+@lru_cache(maxsize=1)
+def _clean_code_stamp() -> str:
+    """Digest of the load/normalize code, so an upgrade or local edit invalidates the cleaned cache."""
+    h = hashlib.sha256()
+    for name in _CLEAN_SOURCES:
+        h.update((Path(__file__).parent / name).read_bytes())
+    return h.hexdigest()
+
+
+def _input_stamp(input: Path) -> str:
+    """Cache validation stamp: the CSV's resolved path, size and mtime (ns), plus the cleaning code digest."""
+    st = input.stat()
+    return f"{input.resolve()}\n{st.st_size}\n{st.st_mtime_ns}\n{_clean_code_stamp()}"
+
+
+def _load_clean(input: Path, cache: Path | None) -> pd.DataFrame:
+    """Load and normalize the input CSV, reusing a Parquet cache when fresh.
+
+    `normalize` is deterministic given the CSV contents, so when `cache`
+    was written from this very file (same resolved path, size and mtime)
+    by the same loading/cleaning code, as recorded in a ``.key`` sidecar
+    next to it, the cleaned frame is read back instead of re-parsing and
+    re-normalizing the CSV.
+
+    Args:
+        input: Path to the source CSV.
+        cache: Parquet file holding the cleaned frame, or None to disable caching.
+
+    Returns:
+        The normalized matches DataFrame.
+    """
+    import pandas as pd
+    from .io_csv import load_csv
+    from .clean import normalize
+
+    stamp = _input_stamp(input)
+    key_file = cache.with_suffix(".key") if cache is not None else None
+    if key_file is not None and cache.exists() and key_file.exists() and key_file.read_text(encoding="utf-8") == stamp:
+        return pd.read_parquet(cache, engine="pyarrow")
+
+    # Read raw CSV with the Arrow parser, text keys straight to categoricals;
+    # basic schema validation happens inside load_csv.
+    raw = load_csv(str(input), engine="pyarrow", dtype_backend="pyarrow", categorical=True)
+
+    # Normalize into a consistent schema (types, booleans, derived fields, etc.).
+    df = normalize(raw)
+
+    if cache is not None:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        # Drop the old key first so a half-written cache never validates.
+        key_file.unlink(missing_ok=True)
+        df.to_parquet(cache, engine="pyarrow")
+        key_file.write_text(stamp, encoding="utf-8")
+    return df
 
 
 def main(
@@ -42,6 +101,8 @@ def main(
     elo_mov: Annotated[str, typer.Option("--elo-mov", help="MoV scaling: none|simple")] = "none",
     calibration_bins: Annotated[int, typer.Option("--calibration-bins", min=2, max=50)] = 10,
     scout_recent: Annotated[int, typer.Option("--scout-recent", help="N recent matches for scouting")] = 10,
+    write_parquet: Annotated[bool, typer.Option("--parquet/--no-parquet", help="Write matches.parquet")] = True,
+    cache: Annotated[bool, typer.Option(help="Reuse cleaned data and summary cached under <out>/.cache when the CSV is unchanged")] = True,
 ):
     """Compute metrics and build a static HTML report from match CSVs.
 
@@ -75,11 +136,23 @@ def main(
             Number of reliability bins for calibration (0–1 split into bins).
         scout_recent : int, default 10
             Number of most-recent matches to summarize for opponent scouting.
+        write_parquet : bool, default True
+            Write the cleaned matches (with Elo columns) to ``matches.parquet``;
+            pass ``--no-parquet`` to skip the write when only the report is needed.
+        cache : bool, default True
+            Reuse the cleaned matches and the summary cached in ``<out>/.cache``
+            when the CSV (and the options) have not changed since; pass
+            ``--no-cache`` to force a reload and re-aggregation.
 
     Raises:
         typer.BadParameter: If the input path does not exist.
     """
 
+    import pandas as pd
+    from .metrics import build_summary, build_summary_cached
+    from .report import build_html_report
+    from .elo import run_elo
+
     # --- Validate paths / prepare output ---
     if not input.exists():
         # Fail fast with actionable message if the input path is wrong.
@@ -89,11 +162,8 @@ def main(
     out.mkdir(parents=True, exist_ok=True)
 
     # --- Load → clean → compute metrics ---
-    # Read raw CSV; basic schema validation happens inside load_csv.
-    raw = load_csv(str(input))
-
-    # Normalize into a consistent schema (types, booleans, derived fields, etc.).
-    df = normalize(raw)
+    # Loading + normalizing is skipped when the cleaned-data cache was built from this same CSV.
+    df = _load_clean(input, out / ".cache" / "matches_clean.parquet" if cache else None)
 
     # Stage 2 — add Elo columns and final ratings
     final_ratings = None
@@ -102,11 +172,10 @@ def main(
         if final_ratings is not None:
             final_ratings.to_csv(out / "ratings.csv", header=["rating"])
 
-    # Persist the cleaned matches for later analysis / debugging.
-    df.to_parquet(out / "matches.parquet")
-
-    # Build summary dict with overall KPIs and optional breakdowns.
-    summary = build_summary(df, per_tournament=per_tournament, split_phase=split_phase, calibration_bins=calibration_bins, scout_recent=scout_recent, final_ratings=final_ratings)
+    # Build summary dict with overall KPIs and optional breakdowns
+    # (reused from <out>/.cache when the data and options are unchanged).
+    summary_kwargs = dict(per_tournament=per_tournament, split_phase=split_phase, calibration_bins=calibration_bins, scout_recent=scout_recent, final_ratings=final_ratings)
+    summary = build_summary_cached(df, out / ".cache", **summary_kwargs) if cache else build_summary(df, **summary_kwargs)
 
     # pass small Elo block to the template
     if final_ratings is not None:
@@ -115,29 +184,26 @@ def main(
             "table": final_ratings.reset_index().rename(columns={"index": "entity", "final_ratings": "rating"}).to_dict(orient="records"),
         }
     
-    # Prepare a “recent matches” section for the template, take the 10 most recent rows
-    recent = (
-        df.sort_values(["date", "tournament_no", "game_no"])
-        .tail(10)
-        .copy()
+    # Prepare a “recent matches” section for the template, take the 10 most recent rows.
+    # Missing dates / game numbers sort last, exactly as the full sort always placed them.
+    recent = df.sort_values(["date", "tournament_no", "game_no"], na_position="last").tail(10)
+
+    # p(win) clipped to 0..1, and numeric result (1 for W, 0 for L; tweak if you ever have draws)
+    pwin = pd.to_numeric(recent["p_win_pre"], errors="coerce").fillna(0.0).clip(0, 1)
+    result_num = (recent["result"] == "W").astype(float)
+
+    # Derive every display column in a single assign (one block-manager update):
+    # YYYY-MM-DD date, delta = result - p(win), and the upset flags.
+    recent = recent.assign(
+        date_str=recent["date"].dt.strftime("%Y-%m-%d"),
+        result_num=result_num,
+        p_win_pre=pwin,
+        delta=result_num - pwin,
+        favored_loss=(recent["result"] == "L") & (pwin > 0.5),
+        underdog_win=(recent["result"] == "W") & (pwin < 0.5),
+        p_win_pct=(pwin * 100).round().astype(int),
     )
 
-    # display date with format YYYY-MM-DD
-    recent["date_str"] = recent["date"].dt.strftime("%Y-%m-%d")
-
-    # numeric result (1 for W, 0 for L; tweak if you ever have draws)
-    recent["result_num"] = (recent["result"] == "W").astype(float)
-
-    # delta = result - p(win)
-    recent["delta"] = recent["result_num"] - recent["p_win_pre"].astype(float)
-
-    # upset flags
-    recent["favored_loss"] = (recent["result"] == "L") & (recent["p_win_pre"] > 0.5)
-    recent["underdog_win"] = (recent["result"] == "W") & (recent["p_win_pre"] < 0.5)
-
-    recent["p_win_pre"] = pd.to_numeric(recent["p_win_pre"], errors="coerce").fillna(0.0).clip(0, 1)
-    recent["p_win_pct"] = (recent["p_win_pre"] * 100).round().astype(int)
-
     # keep whatever fields you already render + the new ones
     keep_cols = [
         "date_str","opponent","home_or_away","result",
@@ -145,7 +211,13 @@ def main(
         "map","score","ot","goals_for","goals_against",
     ]
 
-    summary["recent"] = recent[keep_cols].to_dict("records")
+    # Missing categorical cells go to the template as None (as the plain string
+    # columns did before they became categorical); other columns are left as is.
+    records = recent[keep_cols]
+    cats = [c for c in keep_cols if isinstance(records[c].dtype, pd.CategoricalDtype)]
+    records = records.astype({c: object for c in cats})
+    records[cats] = records[cats].where(records[cats].notna(), None)
+    summary["recent"] = records.to_dict("records")
     
     # Aggregate one-line recent summary for the Elo card
     wins = int(recent["result_num"].sum())
@@ -162,18 +234,31 @@ def main(
 
 
 
-    # --- Persist rollups (guard against empties) ---
-    opp = summary.get("opponents", pd.DataFrame())
-    if hasattr(opp, "to_csv") and not getattr(opp, "empty", True):
-        opp.to_csv(out / "summary_opponents.csv", index=False)
-
-    maps = summary.get("maps", pd.DataFrame())
-    if hasattr(maps, "to_csv") and not getattr(maps, "empty", True):
-        maps.to_csv(out / "summary_maps.csv", index=False)
-
-    tourn = summary.get("tournaments", pd.DataFrame())
-    if hasattr(tourn, "to_csv") and not getattr(tourn, "empty", True):
-        tourn.to_csv(out / "summary_tournaments.csv", index=False)
+    # --- Persist artifacts (independent I/O-bound writes, run on a thread pool) ---
+    # to_parquet / to_csv spend most of their time in C with the GIL released.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        jobs = []
+
+        # Cleaned matches for later analysis / debugging (one row group, Snappy).
+        if write_parquet:
+            jobs.append(pool.submit(
+                df.to_parquet,
+                out / "matches.parquet",
+                engine="pyarrow",
+                compression="snappy",
+                row_group_size=max(len(df), 1),
+                use_dictionary=True,
+            ))
+
+        # Rollups (guard against empties).
+        for name in ("opponents", "maps", "tournaments"):
+            table = summary.get(name, pd.DataFrame())
+            if hasattr(table, "to_csv") and not getattr(table, "empty", True):
+                jobs.append(pool.submit(table.to_csv, out / f"summary_{name}.csv", index=False))
+
+        # Surface any write error.
+        for job in jobs:
+            job.result()
 
     # --- Render the static HTML report ---
     build_html_report(df, summary, out / "report.html")
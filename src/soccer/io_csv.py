@@ -16,19 +16,32 @@ Typical usage:
 """
 
 from __future__ import annotations
+from typing import Optional
 import pandas as pd
 
 
 REQUIRED_COLUMNS = ["date", "tournament_no", "round", "game_no", "map", "opponent", "home_or_away", "win_or_loss", "ot",
 "score", "goals_for", "goals_against", "player_1_goals", "player_2_goals", "shots_for", "shots_against"]
 
+# Low-cardinality text columns that can be parsed straight into `category` dtype.
+CATEGORY_COLUMNS = ["round", "map", "opponent", "home_or_away", "win_or_loss", "ot"]
 
-def load_csv(path: str) -> pd.DataFrame:
+
+def load_csv(path: str, engine: Optional[str] = None, dtype_backend: Optional[str] = None, categorical: bool = False) -> pd.DataFrame:
     """Load a CSV and validate that all required columns are present.
 
     Args:
         path:
             Filesystem path to a CSV file.
+        engine:
+            Optional `pandas.read_csv` parser engine (e.g. "pyarrow" for the
+            multithreaded Arrow reader). Defaults to pandas' own choice.
+        dtype_backend:
+            Optional `pandas.read_csv` dtype backend (e.g. "pyarrow" to keep
+            columns in Arrow memory). Defaults to NumPy-backed dtypes.
+        categorical:
+            If True, return `CATEGORY_COLUMNS` as `category` dtype so later
+            groupbys work on integer codes instead of hashing strings.
     
     Returns:
         A `pandas.DataFrame` 
@@ -50,11 +63,23 @@ def load_csv(path: str) -> pd.DataFrame:
     """
 
 
-    # Read the CSV
-    df = pd.read_csv(path)
+    # Read the CSV (only forward the parser options that were requested)
+    kwargs = {}
+    if engine is not None:
+        kwargs["engine"] = engine
+    if dtype_backend is not None:
+        kwargs["dtype_backend"] = dtype_backend
+    if categorical:
+        # Parsed as strings, then encoded: the Arrow reader cannot cast an
+        # all-empty column (null type) straight to category.
+        kwargs["dtype"] = {c: "string" for c in CATEGORY_COLUMNS}
+    df = pd.read_csv(path, **kwargs)
+    if categorical:
+        df = df.astype({c: "category" for c in CATEGORY_COLUMNS if c in df.columns})
 
     # Validate schema: all required columns must be present.
-    missing = [c for c in REQUIRED_COLUMNS if c not in df.columns]
+    cols = set(df.columns)
+    missing = [c for c in REQUIRED_COLUMNS if c not in cols]
     if missing:
         raise ValueError(f"Missing required columns: {missing}")
 
@@ -14,7 +14,8 @@ with at least these columns:
   - date: sortable (datetime or ISO string) for “recent” windows
 
 Outputs:
-- `_summarize(...)` returns grouped rollups.
+- `_summarize_many(...)` returns grouped rollups for several keys at once.
+- `build_summary_cached(...)` memoizes `build_summary` on disk by input content.
 - `build_summary(...)` returns a dict containing:
     - overall KPIs
     - breakdowns (opponent, map, tournament, phase, home/away)
@@ -26,8 +27,14 @@ Outputs:
 
 from __future__ import annotations
 
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, Any
+import hashlib
+import pickle
+import numpy as np
 import pandas as pd
+from ._jit import compiled
 
 # Optional external helpers (safe to miss)
 try:
@@ -36,6 +43,46 @@ except Exception:
     _ext_brier_score = None
     _ext_reliability_table = None
 
+# Optional fused evaluator for the fallback Brier score (safe to miss)
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+
+# Below this size plain NumPy is as fast; numexpr's threading only pays off on long logs.
+_NUMEXPR_MIN_SIZE = 10_000
+
+# Below this size the bincount path is already fast; skip the JIT dispatch.
+_NUMBA_MIN_SIZE = 100_000
+
+
+def _group_loop(codes, ngroups, has_result, is_win, is_loss, goals):
+    """Per-group games/wins/losses and goal-column sums in one pass over the rows.
+
+    Compiled via `compiled` for long logs. Rows with a negative code (missing
+    key) are skipped, like groupby's dropna.
+    """
+    counts = np.zeros((ngroups, 3), np.int64)
+    sums = np.zeros((ngroups, goals.shape[1]), np.int64)
+    for i in range(codes.size):
+        c = codes[i]
+        if c < 0:
+            continue
+        counts[c, 0] += has_result[i]
+        counts[c, 1] += is_win[i]
+        counts[c, 2] += is_loss[i]
+        for j in range(goals.shape[1]):
+            sums[c, j] += goals[i, j]
+    return counts, sums
+
+
+# Per-match goal columns summed by every rollup.
+_GOAL_COLUMNS = ["goals_for", "goals_against", "player_1_goals", "player_2_goals"]
+
+# Text grouping keys, grouped as categoricals.
+_TEXT_KEYS = ("opponent", "map", "home_or_away", "phase")
+
 
 # -----------------------
 # Simple helpers (counts)
@@ -65,15 +112,66 @@ def _losses(s: pd.Series) -> int:
     return int((s == "L").sum())
 
 
+def _fast_sums(df: pd.DataFrame, cols: list[str]) -> Dict[str, int]:
+    """Total each column of `df[cols]` as a Python int, skipping missing values.
+
+    Integer columns (including the nullable Int64 that `clean.normalize`
+    produces) are summed as a single int64 block with missing values as 0;
+    anything else falls back to pandas' float-aware `sum(skipna=True)`.
+    """
+    block = df[cols]
+    if all(pd.api.types.is_integer_dtype(dt) for dt in block.dtypes):
+        totals = block.to_numpy(dtype=np.int64, na_value=0).sum(axis=0)
+    else:
+        totals = block.sum(skipna=True).to_numpy()
+    return {c: int(t) for c, t in zip(cols, totals)}
+
+
+def _with_outcome_flags(df: pd.DataFrame) -> pd.DataFrame:
+    """Return `df` plus int8 `_is_win` / `_is_loss` indicator columns.
+
+    The grouped win/loss counts in `_summarize_many` then sum these flags per
+    group instead of calling `_wins` / `_losses` once per group from Python.
+
+    Args:
+        df: Matches DataFrame with a 'result' column ("W"/"L").
+
+    Returns:
+        A new DataFrame (the caller's frame is not modified).
+    """
+    return df.assign(
+        _is_win=df["result"].eq("W").fillna(False).astype("int8"),
+        _is_loss=df["result"].eq("L").fillna(False).astype("int8"),
+    )
+
+
 # -----------------------------------
 # Grouped Breakdowns (opponent/map/etc.)
 # -----------------------------------
 
-def _summarize(g: pd.core.groupby.generic.DataFrameGroupBy) -> pd.DataFrame:
-    """Aggregate wins/losses and goal stats for each group.
+def _group_sums(codes, ngroups, has_result, is_win, is_loss, goals):
+    """Per-group games/wins/losses and goal-column sums via `np.bincount`.
+
+    Same contract as `_group_loop`: rows with a negative code (missing key)
+    are skipped, and both outputs are int64 arrays with one row per group.
+    Missing keys are counted into a spare trailing slot that is dropped,
+    rather than masking every weight column.
+    """
+    idx = np.where(codes < 0, ngroups, codes)
+    weights = (has_result, is_win, is_loss, *goals.T)
+    totals = np.stack([np.bincount(idx, weights=w, minlength=ngroups + 1) for w in weights], axis=1)
+    totals = totals[:ngroups].astype(np.int64)
+    return totals[:, :3], totals[:, 3:]
+
+
+def _summary_table(key: str, key_values: Any, games: Any, wins: Any, losses: Any, goals: Dict[str, Any]) -> pd.DataFrame:
+    """Assemble a rollup table from per-group sums with a single DataFrame constructor.
 
     Args:
-        g: DataFrameGroupBy (e.g., df.groupby("opponent")).
+        key: Name of the grouping column (first output column).
+        key_values: One group label per row.
+        games, wins, losses: Per-group counts.
+        goals: Per-group sums for each of `_GOAL_COLUMNS`.
 
     Returns:
         DataFrame with one row per group containing:
@@ -84,31 +182,76 @@ def _summarize(g: pd.core.groupby.generic.DataFrameGroupBy) -> pd.DataFrame:
           - win_pct (wins / games, rounded to 3)
           - p1_goal_pct / p2_goal_pct (share of GF; 0.0 if GF == 0)
     """
-    out = (
-        g.agg(
-            games=("result", "count"),
-            wins=("result", _wins),
-            losses=("result", _losses),
-            goals_for=("goals_for", "sum"),
-            goals_against=("goals_against", "sum"),
-            player_1_goals=("player_1_goals", "sum"),
-            player_2_goals=("player_2_goals", "sum"),
-        )
-        .assign(
-            goal_diff=lambda x: x["goals_for"] - x["goals_against"],
-            win_pct=lambda x: (x["wins"] / x["games"]).round(3).fillna(0.0),
-        )
-        .reset_index()
-    )
+    # Ratios on plain float64 arrays (group sums have no missing values), not nullable Float64.
+    games_f = np.asarray(games, dtype=np.float64)
+    wins_f = np.asarray(wins, dtype=np.float64)
+    gf = np.asarray(goals["goals_for"], dtype=np.float64)
+    p1 = np.asarray(goals["player_1_goals"], dtype=np.float64)
+    p2 = np.asarray(goals["player_2_goals"], dtype=np.float64)
+
+    # Denominators clamped to >= 1 so no lane divides by zero (counts are whole numbers,
+    # and the clamped lanes are replaced by 0.0 anyway).
+    gf_safe = np.maximum(gf, 1)
+    return pd.DataFrame({
+        key: key_values,
+        "games": games,
+        "wins": wins,
+        "losses": losses,
+        **goals,
+        "goal_diff": goals["goals_for"] - goals["goals_against"],
+        "win_pct": np.where(games_f > 0, np.round(wins_f / np.maximum(games_f, 1), 3), 0.0),
+        # Goal share %; guard against GF == 0
+        "p1_goal_pct": np.where(gf > 0, np.round(p1 / gf_safe * 100, 1), 0.0),
+        "p2_goal_pct": np.where(gf > 0, np.round(p2 / gf_safe * 100, 1), 0.0),
+    })
+
+
+def _maybe_sort(table: pd.DataFrame, by: str | list[str], ascending: bool | list[bool] = True) -> pd.DataFrame:
+    """Sort `table` by `by`; tables with fewer than two rows are returned as-is (no sort overhead)."""
+    return table if len(table) < 2 else table.sort_values(by, ascending=ascending)
+
+
+def _sum_dtype(dtype: Any) -> Any:
+    """Dtype of a group sum over a column of `dtype`, as groupby(...).sum() gives it.
+
+    Narrow NumPy integers widen to int64 (so totals cannot overflow);
+    nullable/Arrow dtypes are kept as they are.
+    """
+    return np.promote_types(dtype, np.int64) if isinstance(dtype, np.dtype) else dtype
+
+
+def _summarize_many(df: pd.DataFrame, keys: list[str]) -> Dict[str, pd.DataFrame]:
+    """Compute the rollup table (see `_summary_table`) for several grouping keys over one prepared frame.
 
-    # Percentages as safe numeric (nullable Float64)
-    gf = pd.to_numeric(out["goals_for"], errors="coerce").astype("Float64")
-    p1 = pd.to_numeric(out["player_1_goals"], errors="coerce").astype("Float64")
-    p2 = pd.to_numeric(out["player_2_goals"], errors="coerce").astype("Float64")
+    The frame is prepared once by the caller (see `_with_outcome_flags`) and
+    its summed columns are extracted once. Each key is then factorized to
+    integer codes and reduced with `_group_sums` (or the compiled `_group_loop`); no
+    pandas groupby, and nothing is assigned or copied per key.
 
-    # Goal share %; guard against GF == 0
-    out["p1_goal_pct"] = ((p1 / gf) * 100).where(gf > 0, 0.0).round(1)
-    out["p2_goal_pct"] = ((p2 / gf) * 100).where(gf > 0, 0.0).round(1)
+    Args:
+        df: Frame with 'result', the outcome flags, the goal columns and `keys`.
+        keys: Grouping columns to summarize.
+
+    Returns:
+        Dict mapping each key to its rollup table. Groups come in order
+        of first appearance (unsorted); only observed keys appear and missing
+        keys are dropped, as with groupby(sort=False, observed=True).
+    """
+    # Extract the summed columns once; every key reuses them.
+    has_result = df["result"].notna().to_numpy(dtype=np.int64)
+    is_win = df["_is_win"].to_numpy(dtype=np.int64)
+    is_loss = df["_is_loss"].to_numpy(dtype=np.int64)
+    goals = df[_GOAL_COLUMNS].to_numpy(dtype=np.int64, na_value=0)
+
+    # Large logs use the compiled single-pass kernel when Numba is installed.
+    group_sums = (compiled(_group_loop) if len(df) >= _NUMBA_MIN_SIZE else None) or _group_sums
+
+    out = {}
+    for key in keys:
+        codes, uniques = pd.factorize(df[key], sort=False)
+        counts, sums = group_sums(codes.astype(np.int64), len(uniques), has_result, is_win, is_loss, goals)
+        goal_sums = {c: pd.array(sums[:, j]).astype(_sum_dtype(df[c].dtype)) for j, c in enumerate(_GOAL_COLUMNS)}
+        out[key] = _summary_table(key, uniques, counts[:, 0], counts[:, 1], counts[:, 2], goal_sums)
     return out
 
 
@@ -139,22 +282,25 @@ def _scouting_recent(df: pd.DataFrame, n: int = 10) -> pd.DataFrame:
 
     recent = df.sort_values("date", na_position="last").tail(n) if "date" in df.columns else df.tail(n)
 
+    # One named aggregation over native reducers (no per-group lambda, no merge for last_date).
+    agg_kwargs = {
+        "n": ("result", "size"),
+        "wins": ("_is_win", "sum"),
+        "last_result": ("result", "last"),
+    }
+    if "date" in recent.columns:
+        agg_kwargs["last_date"] = ("date", "max")
+
     scout = (
-        recent.groupby("opponent", dropna=False)
-        .agg(
-            n=("result", "size"),
-            wins=("result", lambda s: int((s == "W").sum())),
-            last_result=("result", "last"),
-        )
+        recent.assign(_is_win=recent["result"].eq("W").fillna(False).astype("int8"))
+        .groupby("opponent", dropna=False, sort=False, observed=True)
+        .agg(**agg_kwargs)
         .reset_index()
     )
-    scout["win_pct"] = (scout["wins"] / scout["n"]).round(3)
+    scout.insert(scout.columns.get_loc("last_result") + 1, "win_pct", (scout["wins"] / scout["n"]).round(3))
 
-    if "date" in recent.columns:
-        last_date = recent.groupby("opponent")["date"].max().reset_index(name="last_date")
-        scout = scout.merge(last_date, on="opponent", how="left")
-
-    return scout.sort_values(["n", "win_pct"], ascending=[False, False])
+    # Ties keep the alphabetical opponent order.
+    return scout.sort_values(["n", "win_pct", "opponent"], ascending=[False, False, True], na_position="last")
 
 
 # -----------------------
@@ -162,10 +308,12 @@ def _scouting_recent(df: pd.DataFrame, n: int = 10) -> pd.DataFrame:
 # -----------------------
 
 def _fallback_brier_and_bins(df: pd.DataFrame, bins: int = 10) -> Dict[str, Any]:
-    """Compute Brier score and reliability bins using only pandas.
+    """Compute Brier score and quantile reliability bins with plain NumPy.
 
-    This is used when external helpers from `soccer.calibration` cannot be
-    imported. If `p_win_pre` or `result` are missing / entirely null, returns
+    Bin edges come from `np.quantile` (matching `pd.qcut`), rows are binned
+    with `np.searchsorted` and summed with `np.bincount`; on long inputs the
+    Brier score is evaluated by numexpr when it is installed. This is used
+    when external helpers from `soccer.calibration` cannot be imported. If `p_win_pre` or `result` are missing / entirely null, returns
     an empty calibration dict.
 
     Args:
@@ -187,20 +335,40 @@ def _fallback_brier_and_bins(df: pd.DataFrame, bins: int = 10) -> Dict[str, Any]
     if not mask.any():
         return {"brier": None, "bins": []}
 
-    p = p[mask]
-    y = y[mask]
-
-    brier = float(((p - y) ** 2).mean())
+    p_arr = p[mask].to_numpy(dtype=np.float64)
+    y_arr = y[mask].to_numpy(dtype=np.float64)
 
-    # Quantile bins; drop duplicates when too few unique p's
-    bins_df = (
-        pd.DataFrame({"p": p, "y": y})
-        .assign(bin=lambda x: pd.qcut(x["p"], q=bins, duplicates="drop"))
-        .groupby("bin", as_index=False)
-        .agg(n=("y", "size"), p_mean=("p", "mean"), win_rate=("y", "mean"))
-        .assign(p_mean=lambda x: x["p_mean"].round(3),
-                win_rate=lambda x: x["win_rate"].round(3))
-    )
+    if ne is not None and p_arr.size >= _NUMEXPR_MIN_SIZE:
+        # One fused subtract-square-sum pass, no temporaries.
+        brier = float(ne.evaluate("sum((p_arr - y_arr) ** 2)")) / p_arr.size
+    else:
+        brier = float(((p_arr - y_arr) ** 2).mean())
+
+    # Quantile edges; duplicates dropped when too few unique p's (as pd.qcut(duplicates="drop")).
+    # Like pd.qcut, levels that aren't exact in base 2 are nudged up so edges land on data points.
+    levels = np.linspace(0.0, 1.0, bins + 1)
+    np.putmask(levels, bins * levels != np.arange(bins + 1), np.nextafter(levels, 1))
+    edges = np.unique(np.quantile(p_arr, levels))
+    nbins = edges.size - 1
+    if nbins < 1:
+        # A single distinct p leaves no bin (pd.qcut yields no categories either).
+        return {"brier": round(brier, 4), "bins": []}
+
+    # Right-closed bin index per p (lowest edge included), then per-bin counts and sums.
+    idx = np.clip(np.searchsorted(edges[1:-1], p_arr, side="left"), 0, nbins - 1)
+    n = np.bincount(idx, minlength=nbins)
+    p_sum = np.bincount(idx, weights=p_arr, minlength=nbins)
+    y_sum = np.bincount(idx, weights=y_arr, minlength=nbins)
+
+    # Labels exactly as pd.qcut formats them; only bins that received rows are reported.
+    labels = pd.cut(edges[1:], edges, include_lowest=True).categories
+    keep = n > 0
+    bins_df = pd.DataFrame({
+        "bin": labels[keep],
+        "n": n[keep],
+        "p_mean": np.round(p_sum[keep] / n[keep], 3),
+        "win_rate": np.round(y_sum[keep] / n[keep], 3),
+    })
 
     return {
         "brier": round(brier, 4),
@@ -245,15 +413,23 @@ def build_summary(
           - (optional) elo, calibration, scouting, scout_recent
     """
 
+    # Coerce the goal columns to numbers once (on a new frame; the caller's is untouched),
+    # so neither the overall block nor the rollups re-run `pd.to_numeric`. Columns that
+    # are already numeric (Int64 after `clean.normalize`) are left as they are.
+    coerced = {
+        c: pd.to_numeric(df[c], errors="coerce")
+        for c in _GOAL_COLUMNS
+        if not pd.api.types.is_numeric_dtype(df[c])
+    }
+    if coerced:
+        df = df.assign(**coerced)
+
     # ---- OVERALL ----
     overall = {
         "games": int(len(df)),
         "wins": _wins(df["result"]),
         "losses": _losses(df["result"]),
-        "goals_for": int(pd.to_numeric(df["goals_for"], errors="coerce").sum(skipna=True)),
-        "goals_against": int(pd.to_numeric(df["goals_against"], errors="coerce").sum(skipna=True)),
-        "player_1_goals": int(pd.to_numeric(df["player_1_goals"], errors="coerce").sum(skipna=True)),
-        "player_2_goals": int(pd.to_numeric(df["player_2_goals"], errors="coerce").sum(skipna=True)),
+        **_fast_sums(df, _GOAL_COLUMNS),
     }
     overall["goal_diff"] = overall["goals_for"] - overall["goals_against"]
     overall["win_pct"] = round((overall["wins"] / overall["games"]) if overall["games"] else 0.0, 3)
@@ -269,27 +445,43 @@ def build_summary(
         overall["player_2_goal_share_percentage"] = 0.0
 
     # ---- BREAKDOWNS ----
-    opponents = _summarize(df.groupby("opponent")) if "opponent" in df.columns else pd.DataFrame()
-    maps      = _summarize(df.groupby("map"))      if "map"      in df.columns else pd.DataFrame()
-
-    tournaments = pd.DataFrame()
-    if per_tournament and "tournament_no" in df.columns:
-        tournaments = _summarize(df.groupby("tournament_no"))
-
-    phases = pd.DataFrame()
-    if split_phase and "phase" in df.columns:
-        phases = _summarize(df.groupby("phase"))
-
-    home_away = pd.DataFrame()
-    if "home_or_away" in df.columns:
-        ha = df["home_or_away"].fillna("Unknown")
-        home_away = _summarize(df.assign(home_or_away=ha).groupby("home_or_away"))
-
+    # Prepare one column-pruned frame (outcome flags, goal columns, grouping keys)
+    # and reuse it for every breakdown.
+    # An empty log skips grouping altogether, as do keys with no values at all
+    # (home/away is kept: its missing values are reported as "Unknown").
+    keys = [
+        c for c in ("opponent", "map", "tournament_no", "phase", "home_or_away")
+        if c in df.columns
+        and (per_tournament or c != "tournament_no")
+        and (split_phase or c != "phase")
+        and (c == "home_or_away" or df[c].notna().any())
+    ] if len(df) else []
+
+    tables: Dict[str, pd.DataFrame] = {}
+    if keys:
+        # Text keys as `category` (a no-op when `clean.normalize`/`load_csv` already did it),
+        # so each groupby works on small integer codes instead of hashing strings.
+        narrow = df[["result", *_GOAL_COLUMNS, *keys]].astype({c: "category" for c in _TEXT_KEYS if c in keys})
+        narrow = _with_outcome_flags(narrow)
+        if "home_or_away" in keys:
+            ha = narrow["home_or_away"]
+            if isinstance(ha.dtype, pd.CategoricalDtype) and "Unknown" not in ha.cat.categories:
+                ha = ha.cat.add_categories("Unknown")
+            narrow["home_or_away"] = ha.fillna("Unknown")
+        tables = _summarize_many(narrow, keys)
+
+    opponents   = tables.get("opponent", pd.DataFrame())
+    maps        = tables.get("map", pd.DataFrame())
+    tournaments = tables.get("tournament_no", pd.DataFrame())
+    phases      = _maybe_sort(tables.get("phase", pd.DataFrame()), "phase")
+    home_away   = _maybe_sort(tables.get("home_or_away", pd.DataFrame()), "home_or_away")
+
+    # Best win_pct first; ties keep the alphabetical key order.
     result: Dict[str, Any] = {
         "overall": overall,
-        "opponents": opponents.sort_values("win_pct", ascending=False) if not opponents.empty else opponents,
-        "maps": maps.sort_values("win_pct", ascending=False) if not maps.empty else maps,
-        "tournaments": tournaments.sort_values("tournament_no") if not tournaments.empty else tournaments,
+        "opponents": _maybe_sort(opponents, ["win_pct", "opponent"], ascending=[False, True]),
+        "maps": _maybe_sort(maps, ["win_pct", "map"], ascending=[False, True]),
+        "tournaments": _maybe_sort(tournaments, "tournament_no"),
         "phases": phases,
         "home_away": home_away,
     }
@@ -336,3 +528,103 @@ def build_summary(
     result["scout_recent"] = int(scout_recent)
 
     return result
+
+
+# -------------------------
+# Cached summary (on disk)
+# -------------------------
+
+# Modules whose code shapes the summary; their source is part of the cache key.
+_SUMMARY_SOURCES = ("metrics.py", "calibration.py")
+
+
+@lru_cache(maxsize=1)
+def _code_stamp() -> bytes:
+    """Digest of the summary code itself, so an upgrade or local edit invalidates cached summaries."""
+    h = hashlib.sha256()
+    for name in _SUMMARY_SOURCES:
+        h.update((Path(__file__).parent / name).read_bytes())
+    return h.digest()
+
+
+def _dtype_tag(dtype: Any) -> str:
+    """Storage-independent dtype name for the cache key.
+
+    A Parquet round-trip keeps the values but may swap the physical type
+    (Arrow vs Python strings under a categorical, datetime unit), so those
+    details are left out and such frames share a key.
+    """
+    if isinstance(dtype, pd.CategoricalDtype):
+        return "category"
+    if pd.api.types.is_datetime64_dtype(dtype):
+        return "datetime64"
+    if pd.api.types.is_string_dtype(dtype):
+        return "string"
+    return str(dtype)
+
+
+def _summary_cache_key(df: pd.DataFrame, final_ratings: pd.Series | None, options: tuple) -> str:
+    """Content hash of everything `build_summary` reads: rows, schema, ratings, options and code."""
+    h = hashlib.sha256(_code_stamp())
+    h.update(repr([(c, _dtype_tag(t)) for c, t in df.dtypes.items()]).encode())
+    # Datetimes are hashed at one fixed unit, so s/ms/ns storage of the same dates agrees.
+    dates = {c: "datetime64[ns]" for c, t in df.dtypes.items() if pd.api.types.is_datetime64_dtype(t)}
+    h.update(pd.util.hash_pandas_object(df.astype(dates) if dates else df, index=False).to_numpy().tobytes())
+    if final_ratings is not None:
+        h.update(pd.util.hash_pandas_object(final_ratings, index=True).to_numpy().tobytes())
+    h.update(repr(options).encode())
+    return h.hexdigest()[:32]
+
+
+def build_summary_cached(
+    df: pd.DataFrame,
+    cache_dir: Path,
+    per_tournament: bool = True,
+    split_phase: bool = True,
+    *,
+    final_ratings: pd.Series | None = None,
+    calibration_bins: int = 10,
+    scout_recent: int = 10,
+) -> Dict[str, Any]:
+    """`build_summary`, memoized on disk by the content of its inputs.
+
+    The cache key hashes every row and dtype of `df` (plus `final_ratings`,
+    the options and the source of the summary code), so any change to the
+    data or the metrics code recomputes; an unchanged re-run loads the
+    pickled summary and skips all aggregation. Only the latest summary is
+    kept in `cache_dir`.
+
+    Args:
+        df: Normalized matches DataFrame.
+        cache_dir: Directory for the cached summary (e.g. `out/.cache`).
+        per_tournament, split_phase, final_ratings, calibration_bins, scout_recent:
+            Passed through to `build_summary`.
+
+    Returns:
+        The same dict `build_summary` returns.
+    """
+    options = (bool(per_tournament), bool(split_phase), int(calibration_bins), int(scout_recent))
+    path = Path(cache_dir) / f"summary_{_summary_cache_key(df, final_ratings, options)}.pkl"
+
+    if path.exists():
+        try:
+            with path.open("rb") as fh:
+                return pickle.load(fh)
+        except Exception:
+            pass  # unreadable/stale pickle: rebuild below
+
+    summary = build_summary(
+        df, per_tournament=per_tournament, split_phase=split_phase,
+        final_ratings=final_ratings, calibration_bins=calibration_bins, scout_recent=scout_recent,
+    )
+
+    # Write atomically, then drop summaries cached for older inputs.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with tmp.open("wb") as fh:
+        pickle.dump(summary, fh, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp.replace(path)
+    for old in path.parent.glob("summary_*.pkl"):
+        if old != path:
+            old.unlink(missing_ok=True)
+    return summary
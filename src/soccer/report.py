@@ -14,34 +14,68 @@ Typical usage:
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 
 import pandas as pd
 import shutil
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
 
 
+# Resolved once at import: src/soccer/report.py -> project root (two parents up) -> templates/
+_TEMPLATE_DIR = Path(__file__).resolve().parents[2] / "templates"
+_STYLES_SRC = _TEMPLATE_DIR / "styles.css"
+
+
+@lru_cache(maxsize=1)
 def _get_template_env() -> Environment:
     """Return a Jinja2 environment rooted at the project's `templates/` directory.
 
-    The `templates/` path is resolved relative to this file:
-    `src/soccer/report.py` -> project root (two parents up) → `templates/`.
+    The `templates/` path (`_TEMPLATE_DIR`) is resolved relative to this file
+    at import time. Built once per process and reused by every render.
 
     Returns:
         A configured `jinja2.Environment` with HTML/XML auto-escaping enabled.
     """
 
-    # templates/src/soccer/report.py  ->  templates/
-    template_dir = Path(__file__).resolve().parents[2] / "templates"
-
     # Load templates from <project>/templates and auto-escape HTML/XML.
     return Environment(
-        loader=FileSystemLoader(str(template_dir)),
+        loader=FileSystemLoader(str(_TEMPLATE_DIR)),
         autoescape=select_autoescape(["html", "xml"]),
     )
 
 
+def _same_file_stamp(src: Path, dst: Path) -> bool:
+    """True if `dst` exists with the same size and mtime as `src` (i.e. already copied)."""
+    if not dst.exists():
+        return False
+    s, d = src.stat(), dst.stat()
+    return s.st_size == d.st_size and s.st_mtime == d.st_mtime
+
+
+def _template_context(summary: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a shallow copy of `summary` with DataFrames converted to lists of records.
+
+    Tables are converted once here, so the template loops over plain dicts.
+    DataFrames nested one level down (e.g. `summary["elo"]["table"]`) are
+    converted too; everything else is passed through unchanged.
+    """
+    def _records(value: Any) -> Any:
+        return value.to_dict(orient="records") if isinstance(value, pd.DataFrame) else value
+
+    return {
+        key: {k: _records(v) for k, v in value.items()} if isinstance(value, dict) else _records(value)
+        for key, value in summary.items()
+    }
+
+
+@lru_cache(maxsize=None)
+def _get_template(name: str) -> Template:
+    """Return the compiled template `name`, parsed once per process."""
+    return _get_template_env().get_template(name)
+
+
 def build_html_report(df: pd.DataFrame, summary: Dict[str, Any], out_path: Path) -> None:
     """Render `templates/report.html` with summary data and write it /out.
 
@@ -56,25 +90,15 @@ def build_html_report(df: pd.DataFrame, summary: Dict[str, Any], out_path: Path)
         >>> build_html_report(df, summary, Path("out/report.html"))  # doctest: +SKIP
     """
 
-    env = _get_template_env()
-    template = env.get_template("report.html")
-    html = template.render(summary=summary)
+    template = _get_template("report.html")
+    context = _template_context(summary)
     out_path = Path(out_path)
-    out_path.write_text(html, encoding="utf-8")
+    # Stream rendered chunks straight to disk instead of building the whole document in memory.
+    template.stream(summary=context).dump(str(out_path), encoding="utf-8")
 
     # --- Copy styles.css next to the generated HTML (so relative <link> works) ---
-    # Prefer the directory the template actually loaded from.
-    tpl_dir = Path(getattr(template, "filename", "")).parent if getattr(template, "filename", None) else None
-    if not tpl_dir or not tpl_dir.exists():
-        # Fallbacks if template.filename isn’t available
-        # repo-root/templates
-        tpl_dir = Path(__file__).resolve().parents[3] / "templates"
-        if not tpl_dir.exists():
-            # second fallback: src/../templates (just in case)
-            tpl_dir = Path(__file__).resolve().parents[2] / "templates"
-
-    src_css = tpl_dir / "styles.css"
+    # The stylesheet sits beside the template in `_TEMPLATE_DIR`.
     dst_css = out_path.parent / "styles.css"
-    if src_css.exists():
+    if _STYLES_SRC.exists() and not _same_file_stamp(_STYLES_SRC, dst_css):
         dst_css.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(src_css, dst_css)
\ No newline at end of file
+        shutil.copy2(_STYLES_SRC, dst_css)  # copy2 keeps the mtime, so the next render can skip it
\ No newline at end of file
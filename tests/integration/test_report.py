@@ -5,7 +5,8 @@
 This verifies the Stage-1 pipeline can:
   1) normalize a minimal raw match row,
   2) compute summary metrics, and
-  3) render an HTML report to disk that contains the expected heading.
+  3) render an HTML report to disk that contains the expected heading,
+  4) copy `styles.css` next to the report only when it is missing or stale.
 
 Run all integration tests:
     pytest tests/integration -q
@@ -15,6 +16,7 @@ Run only this file:
 
 from pathlib import Path
 import pandas as pd
+import soccer.report
 from soccer.clean import normalize
 from soccer.metrics import build_summary
 from soccer.report import build_html_report
@@ -83,3 +85,29 @@ def test_report_writes_file(tmp_path: Path):
     assert "<th>Map</th>" in html
 
 
+def test_report_copies_stylesheet_once(tmp_path: Path, monkeypatch):
+    """Re-rendering into the same directory reuses the already-copied `styles.css`."""
+
+    # ---------- Arrange ----------
+    raw = pd.DataFrame([{
+        "date":"2025-08-01", "tournament_no":1, "round":"Group", "game_no":1,
+        "map":"Battle Dome", "opponent":"Yoshi", "home_or_away":"H", "win_or_loss":"W",
+        "ot":"no", "score":"2-1", "goals_for":2, "goals_against":1,
+        "player_1_goals":1, "player_2_goals":1, "shots_for":10, "shots_against":7
+    }])
+    clean = normalize(raw)
+    summary = build_summary(clean)
+    out_html = tmp_path/"report.html"
+
+    # Count stylesheet copies made by the report module.
+    copies = []
+    real_copy2 = soccer.report.shutil.copy2
+    monkeypatch.setattr(soccer.report.shutil, "copy2", lambda src, dst: copies.append(dst) or real_copy2(src, dst))
+
+    # ---------- Act ----------
+    build_html_report(clean, summary, out_html)
+    build_html_report(clean, summary, out_html)
+
+    # ---------- Assert ----------
+    assert (tmp_path/"styles.css").exists()
+    assert len(copies) == 1
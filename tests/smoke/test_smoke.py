@@ -7,6 +7,10 @@ These tests verify that:
      render a valid HTML report.
   2) The CLI entrypoint (`main`) accepts file paths, produces artifacts, and
      writes the report without parsing sys.argv.
+  3) A repeat CLI run with an unchanged CSV reuses the cleaned-data cache, and
+     a run with a different CSV (or changed cleaning code) does not.
+  4) Missing values in the recent-matches table render as None, and blank
+     dates / game numbers still select the last-sorted recent matches.
 
 Run all smoke tests:
     pytest tests/smoke -q
@@ -15,10 +19,12 @@ Run only this file:
 """
 
 
+import os
 from pathlib import Path
 import pandas as pd
 import pytest
 
+import soccer.io_csv
 from soccer.clean import normalize
 from soccer.metrics import build_summary
 from soccer.report import build_html_report
@@ -100,3 +106,133 @@ def test_smoke_cli(tmp_path: Path):
     # ---------- Assert ----------
     assert (out_dir / "report.html").exists()
     assert (out_dir / "matches.parquet").exists()
+
+
+@pytest.mark.smoke
+@pytest.mark.filterwarnings("ignore:.*observed=False is deprecated.*:FutureWarning")
+def test_smoke_cli_reuses_clean_cache(tmp_path: Path, monkeypatch):
+    """A second CLI run with an unchanged CSV reads the cleaned-data cache.
+
+    The first run writes `<out>/.cache/matches_clean.parquet`; on the second
+    run `load_csv` is patched to fail, so the run only succeeds if the cache
+    short-circuits the load + normalize stage.
+    """
+
+    # ---------- Arrange ----------
+    csv = tmp_path / "data.csv"
+    csv.write_text(
+        "date,tournament_no,round,game_no,map,opponent,home_or_away,win_or_loss,ot,score,goals_for,goals_against,player_1_goals,player_2_goals,shots_for,shots_against\n"
+        "2025-08-01,1,Group,1,Battle Dome,Yoshi,H,W,no,2-1,2,1,1,1,7,6\n",
+        encoding="utf-8",
+    )
+    out_dir = tmp_path / "out"
+    main(input=csv, out=out_dir)
+    assert (out_dir / ".cache" / "matches_clean.parquet").exists()
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("load_csv should not run on a cache hit")
+
+    monkeypatch.setattr("soccer.io_csv.load_csv", _fail)
+
+    # ---------- Act ----------
+    main(input=csv, out=out_dir)
+
+    # ---------- Assert ----------
+    assert (out_dir / "report.html").exists()
+
+
+@pytest.mark.smoke
+def test_smoke_cli_clean_cache_tracks_code(tmp_path: Path, monkeypatch):
+    """A change to the loading/cleaning code invalidates the cleaned-data cache."""
+
+    # ---------- Arrange ----------
+    csv = tmp_path / "data.csv"
+    csv.write_text(
+        "date,tournament_no,round,game_no,map,opponent,home_or_away,win_or_loss,ot,score,goals_for,goals_against,player_1_goals,player_2_goals,shots_for,shots_against\n"
+        "2025-08-01,1,Group,1,Battle Dome,Yoshi,H,W,no,2-1,2,1,1,1,7,6\n",
+        encoding="utf-8",
+    )
+    out_dir = tmp_path / "out"
+    main(input=csv, out=out_dir)
+
+    calls = []
+    real_load = soccer.io_csv.load_csv
+    monkeypatch.setattr(soccer.io_csv, "load_csv", lambda *a, **k: calls.append(1) or real_load(*a, **k))
+    monkeypatch.setattr("soccer.cli._clean_code_stamp", lambda: "edited")
+
+    # ---------- Act ----------
+    main(input=csv, out=out_dir)
+
+    # ---------- Assert ----------
+    assert calls == [1]
+
+@pytest.mark.smoke
+def test_smoke_cli_cache_tracks_input_file(tmp_path: Path):
+    """Switching to a different (older) CSV in the same `--out` does not serve the cached frame."""
+
+    # ---------- Arrange ----------
+    header = "date,tournament_no,round,game_no,map,opponent,home_or_away,win_or_loss,ot,score,goals_for,goals_against,player_1_goals,player_2_goals,shots_for,shots_against\n"
+    a = tmp_path / "a.csv"
+    a.write_text(header + "2025-08-01,1,Group,1,Battle Dome,Yoshi,H,W,no,2-1,2,1,1,1,7,6\n", encoding="utf-8")
+    b = tmp_path / "b.csv"
+    b.write_text(header + "2025-08-02,1,Group,1,Underground,Luigi,A,L,no,0-1,0,1,0,0,3,5\n", encoding="utf-8")
+    # b is older than both a and the cache a's run writes (as after a git checkout).
+    os.utime(b, (0, 0))
+    out_dir = tmp_path / "out"
+
+    # ---------- Act ----------
+    main(input=a, out=out_dir)
+    main(input=b, out=out_dir)
+
+    # ---------- Assert ----------
+    opponents = pd.read_csv(out_dir / "summary_opponents.csv")
+    assert opponents["opponent"].tolist() == ["Luigi"]
+
+
+@pytest.mark.smoke
+def test_smoke_cli_missing_home_away_renders_none(tmp_path: Path):
+    """A blank home_or_away cell reaches the report as None, not the categorical's NaN."""
+
+    # ---------- Arrange ----------
+    csv = tmp_path / "data.csv"
+    csv.write_text(
+        "date,tournament_no,round,game_no,map,opponent,home_or_away,win_or_loss,ot,score,goals_for,goals_against,player_1_goals,player_2_goals,shots_for,shots_against\n"
+        "2025-08-01,1,Group,1,Battle Dome,Yoshi,,W,no,2-1,2,1,1,1,7,6\n",
+        encoding="utf-8",
+    )
+    out_dir = tmp_path / "out"
+
+    # ---------- Act ----------
+    main(input=csv, out=out_dir, cache=False)
+
+    # ---------- Assert ----------
+    text = (out_dir / "report.html").read_text(encoding="utf-8")
+    assert "<td>nan</td>" not in text
+    assert "<td>None</td>" in text
+
+
+@pytest.mark.smoke
+def test_smoke_cli_blank_dates_and_game_numbers(tmp_path: Path):
+    """Blank dates and game numbers don't abort the CLI; the recent card keeps the last-sorted rows."""
+
+    # ---------- Arrange ----------
+    # 12 undated games; game_no 3 and 7 are blank, so they sort after game 12.
+    header = "date,tournament_no,round,game_no,map,opponent,home_or_away,win_or_loss,ot,score,goals_for,goals_against,player_1_goals,player_2_goals,shots_for,shots_against\n"
+    rows = [
+        f",1,Group,{'' if g in (3, 7) else g},Battle Dome,Opp{g:02d},H,W,no,2-1,2,1,1,1,7,6\n"
+        for g in range(1, 13)
+    ]
+    csv = tmp_path / "data.csv"
+    csv.write_text(header + "".join(rows), encoding="utf-8")
+    out_dir = tmp_path / "out"
+
+    # ---------- Act ----------
+    main(input=csv, out=out_dir, cache=False)
+
+    # ---------- Assert ----------
+    text = (out_dir / "report.html").read_text(encoding="utf-8")
+    start = text.index("Recent matches")
+    recent = text[start:text.index("</details>", start)]
+    # Games 1 and 2 are the oldest; the blank-numbered games 3 and 7 are kept.
+    assert "Opp01" not in recent and "Opp02" not in recent
+    assert "Opp03" in recent and "Opp07" in recent and "Opp12" in recent
@@ -8,6 +8,9 @@ These tests validate:
    - the row counts sum to the sample size
    - mean predicted probabilities are in [0, 1] (or NaN for empty bins)
    - the computed `gap` equals (`emp_rate` - `mean_p`) within tolerance.
+3. `reliability_table` leaves NaN and out-of-range probabilities out of every bin,
+   matching `pd.cut`.
+4. The compiled (Numba) binning pass gives the same table as the bincount path.
 
 Run all unit tests:
     pytest tests/unit -q
@@ -21,6 +24,7 @@ import pandas as pd
 import pytest    
 from pytest import approx
 
+import soccer.calibration
 from soccer.calibration import brier_score, reliability_table
 
 
@@ -40,6 +44,26 @@ def test_brier_score_matches_manual():
     assert float(brier_score(y, p)) == approx(manual, rel=1e-9)
 
 
+def test_brier_score_float32_matches_float64():
+    """The float32 fast path agrees with the default float64 result."""
+
+    y = pd.Series([1.0, 0.0, 1.0, 0.0], dtype=float)
+    p = pd.Series([0.90, 0.80, 0.30, 0.20], dtype=float)
+    assert brier_score(y, p, dtype=np.float32) == approx(brier_score(y, p), rel=1e-6)
+
+
+def test_calibration_accepts_numpy_arrays():
+    """Plain float ndarrays give the same results as Series inputs."""
+
+    y = pd.Series([1, 0, 1, 0, 1, 0], dtype=float)
+    p = pd.Series([0.15, 0.25, 0.55, 0.65, 0.85, 0.95], dtype=float)
+
+    assert brier_score(y.to_numpy(), p.to_numpy()) == approx(brier_score(y, p), rel=1e-12)
+    from_arrays = reliability_table(y.to_numpy(), p.to_numpy(), bins=5)
+    from_series = reliability_table(y, p, bins=5)
+    pd.testing.assert_frame_equal(from_arrays, from_series)
+
+
 @pytest.mark.filterwarnings("ignore:.*observed=False is deprecated.*:FutureWarning")
 def test_reliability_table_shape_and_columns():
     """
@@ -71,3 +95,52 @@ def test_reliability_table_shape_and_columns():
     # gap = emp_rate - mean_p
     non_na = tbl.dropna(subset=["emp_rate", "mean_p"])
     assert (non_na["gap"] - (non_na["emp_rate"] - non_na["mean_p"])).abs().max() < 1e-12
+
+
+def test_reliability_table_skips_missing_and_out_of_range():
+    """NaN, negative and >1 probabilities are not counted in any bin (same counts as pd.cut)."""
+
+    # ---------- Arrange ----------
+    y = np.array([1.0, 0.0, 1.0, 1.0, 0.0])
+    p = np.array([0.0, 0.1, np.nan, 1.2, -0.1])
+
+    # ---------- Act ----------
+    tbl = reliability_table(y, p, bins=4)
+
+    # ---------- Assert ----------
+    expected_n = pd.cut(p, np.linspace(0.0, 1.0, 5), include_lowest=True).value_counts()
+    assert tbl["n"].tolist() == expected_n.tolist() == [2, 0, 0, 0]
+    assert abs(tbl.loc[0, "mean_p"] - 0.05) < 1e-12
+    assert abs(tbl.loc[0, "emp_rate"] - 0.5) < 1e-12
+
+
+def test_reliability_table_compiled_pass_matches_bincount(monkeypatch):
+    """Forcing the Numba kernel on (size threshold 0) yields the bincount table exactly."""
+    pytest.importorskip("numba")
+
+    # ---------- Arrange ----------
+    rng = np.random.default_rng(0)
+    p = rng.random(500)
+    y = (rng.random(500) < p).astype(float)
+    expected_tbl = reliability_table(y, p, bins=7)
+
+    # ---------- Act ----------
+    monkeypatch.setattr(soccer.calibration, "_NUMBA_MIN_SIZE", 0)
+    tbl = reliability_table(y, p, bins=7)
+
+    # ---------- Assert ----------
+    pd.testing.assert_frame_equal(tbl, expected_tbl)
+
+
+def test_calibration_rejects_bad_inputs():
+    """Mismatched lengths and non-positive bin counts fail fast with ValueError."""
+
+    y = pd.Series([1.0, 0.0, 1.0])
+    p = pd.Series([0.9, 0.1])
+
+    with pytest.raises(ValueError, match="Length mismatch"):
+        brier_score(y, p)
+    with pytest.raises(ValueError, match="Length mismatch"):
+        reliability_table(y, p)
+    with pytest.raises(ValueError, match="bins"):
+        reliability_table(y.iloc[:2], p, bins=0)
@@ -68,3 +68,24 @@ def test_normalize_basic_2():
     assert row["goal_diff"] == -2
 
 
+def test_normalize_categorical_columns():
+    """`result`, `home_or_away`, `phase` are categoricals; unknown labels become <NA>."""
+
+    # ---------- Arrange ----------
+    df = pd.DataFrame([{
+        "date":"2025-08-03","tournament_no":2,"round":"Group","game_no":3,
+        "map":"Crater Field","opponent":"Wario","home_or_away":"neutral",
+        "win_or_loss":"?","ot":"0","score":"1-1",
+        "goals_for":1,"goals_against":1,"player_1_goals":1,"player_2_goals":0,
+        "shots_for":5,"shots_against":5
+    }])
+
+    # ---------- Act ----------
+    out = normalize(df)
+
+    # ---------- Assert ----------
+    for col in ["result", "home_or_away", "phase"]:
+        assert isinstance(out[col].dtype, pd.CategoricalDtype)
+    assert pd.isna(out.loc[0, "result"])
+    assert pd.isna(out.loc[0, "home_or_away"])
+    assert out.loc[0, "phase"] == "Group"
@@ -5,6 +5,9 @@
 Covers:
   - Elo expected score for A vs B
   - Compute elo per match for team_player vs each opponent
+  - Margin-of-victory scaling of the Elo update
+  - Missing opponents rated as their own entity
+  - Compiled (Numba) loop matching the Python loop
 
 
 This verifies:
@@ -19,7 +22,10 @@ Run this file:
 """
 
 
+import numpy as np
 import pandas as pd
+import pytest
+import soccer.elo
 from soccer.elo import expected, run_elo
 
 
@@ -57,3 +63,78 @@ def test_run_elo_adds_columns():
 
     # 2) Final ratings include the focal player.
     assert "team_player" in ratings.index
+
+
+def test_run_elo_mov_scales_update():
+    """With MoV scaling a bigger winning margin moves the rating further."""
+
+    # ---------- Arrange ----------
+    def _one_win(goals_for, goals_against):
+        return pd.DataFrame([
+            {"date":"2025-08-01","tournament_no":1,"game_no":1,"opponent":"Yoshi",
+             "home_or_away":"H","goals_for":goals_for,"goals_against":goals_against,"result":"W"}
+        ])
+
+    # ---------- Act ----------
+    close, _ = run_elo(_one_win(2, 1), k=20, home_adv=0, mov="simple")
+    rout, _ = run_elo(_one_win(6, 0), k=20, home_adv=0, mov="simple")
+    plain, _ = run_elo(_one_win(6, 0), k=20, home_adv=0, mov="none")
+
+    # ---------- Assert ----------
+    gain_close = close.loc[0, "elo_post"] - close.loc[0, "elo_pre"]
+    gain_rout = rout.loc[0, "elo_post"] - rout.loc[0, "elo_pre"]
+    assert 0 < gain_close < gain_rout
+    # Without MoV an even-odds win moves the rating by exactly K * 0.5.
+    assert plain.loc[0, "elo_post"] - plain.loc[0, "elo_pre"] == 10.0
+
+
+def test_run_elo_missing_opponent_is_separate_entity():
+    """A blank opponent is rated as its own 'nan' entity and never overwrites team_player."""
+
+    # ---------- Arrange ----------
+    df = pd.DataFrame({
+        "date": ["2025-08-01", "2025-08-02"],
+        "tournament_no": [1, 1],
+        "game_no": [1, 2],
+        "opponent": ["Yoshi", None],
+        "home_or_away": ["H", "H"],
+        "result": ["W", "W"],
+    })
+
+    # ---------- Act ----------
+    out, ratings = run_elo(df, k=20, home_adv=0)
+
+    # ---------- Assert ----------
+    # Both matches are played from team_player's own rating against a fresh 1500 opponent.
+    assert out["elo_pre"].tolist() == [1500.0, 1510.0]
+    assert out["elo_post"].iloc[1] > out["elo_pre"].iloc[1]
+    assert out["p_win_pre"].iloc[1] > 0.5
+    assert set(ratings.index) == {"team_player", "Yoshi", "nan"}
+
+
+def test_run_elo_compiled_loop_matches_python(monkeypatch):
+    """The Numba kernel (forced on via the size threshold) gives the same ratings as the Python loop."""
+    pytest.importorskip("numba")
+
+    # ---------- Arrange ----------
+    rng = np.random.default_rng(0)
+    n = 200
+    df = pd.DataFrame({
+        "date": pd.to_datetime("2025-01-01") + pd.to_timedelta(np.arange(n), "D"),
+        "tournament_no": 1,
+        "game_no": np.arange(n),
+        "opponent": rng.choice(["Yoshi", "Mario", "Luigi", None], n),
+        "home_or_away": rng.choice(["H", "A", None], n),
+        "result": rng.choice(["W", "L"], n),
+        "goals_for": rng.integers(0, 6, n),
+        "goals_against": rng.integers(0, 6, n),
+    })
+    python_out, python_final = run_elo(df, mov="simple")
+
+    # ---------- Act ----------
+    monkeypatch.setattr(soccer.elo, "_NUMBA_MIN_SIZE", 0)
+    compiled_out, compiled_final = run_elo(df, mov="simple")
+
+    # ---------- Assert ----------
+    pd.testing.assert_frame_equal(compiled_out, python_out)
+    pd.testing.assert_series_equal(compiled_final, python_final)
@@ -7,6 +7,10 @@ Covers:
   - Safe handling of zero-division for goal share
   - Overall KPIs aggregation
   - Grouped breakdowns (opponents, maps, phases, home/away)
+  - Empty input (zeroed KPIs, empty breakdowns)
+  - On-disk summary cache (hit on identical input, rebuild on data or code change)
+  - Compiled (Numba) rollups matching the bincount path
+  - Fallback calibration's numexpr Brier branch matching NumPy
 
 Run all unit tests:
     pytest tests/unit -q
@@ -15,7 +19,8 @@ Run this file:
 """
 
 import pandas as pd
-from soccer.metrics import build_summary
+import soccer.metrics
+from soccer.metrics import build_summary, build_summary_cached
 import pytest
 
 
@@ -27,19 +32,24 @@ def test_goal_share_percentages_and_totals():
     """
 
     # ---------- Arrange ----------
-    df = pd.DataFrame([
-        {"result":"W","opponent":"Mario","map":"Underground","tournament_no":1,
-         "goals_for":4,"goals_against":2,"player_1_goals":3,"player_2_goals":1,
-         "shots_for":8,"shots_against":6,"home_or_away":"H","date":"2025-08-01"},
-        {"result":"L","opponent":"Mario","map":"Underground","tournament_no":1,
-         "goals_for":1,"goals_against":2,"player_1_goals":0,"player_2_goals":1,
-         "shots_for":5,"shots_against":7,"home_or_away":"A","date":"2025-08-02"},
-    ])
+    df = pd.DataFrame({
+        "result": ["W", "L"],
+        "opponent": ["Mario", "Mario"],
+        "map": ["Underground", "Underground"],
+        "tournament_no": [1, 1],
+        "goals_for": [4, 1],
+        "goals_against": [2, 2],
+        "player_1_goals": [3, 0],
+        "player_2_goals": [1, 1],
+        "shots_for": [8, 5],
+        "shots_against": [6, 7],
+        "home_or_away": ["H", "A"],
+        "date": ["2025-08-01", "2025-08-02"],
+    })
 
     # ---------- Act ----------
     s = build_summary(df)
-    opp = s["opponents"]
-    row = opp.loc[opp["opponent"]=="Mario"].iloc[0]
+    row = s["opponents"].set_index("opponent").loc["Mario"]
 
     # ---------- Assert ----------
     assert row["games"] == 2
@@ -56,15 +66,24 @@ def test_goal_share_handles_zero_division():
     """When GF=0, goal-share percentages should be 0.0 (not NaN or inf)."""
 
     # ---------- Arrange ----------
-    df = pd.DataFrame([
-        {"result":"L","opponent":"Luigi","map":"Battle Dome","tournament_no":1,
-         "goals_for":0,"goals_against":1,"player_1_goals":0,"player_2_goals":0,
-         "shots_for":3,"shots_against":9,"home_or_away":"H","date":"2025-08-03"},
-    ])
+    df = pd.DataFrame({
+        "result": ["L"],
+        "opponent": ["Luigi"],
+        "map": ["Battle Dome"],
+        "tournament_no": [1],
+        "goals_for": [0],
+        "goals_against": [1],
+        "player_1_goals": [0],
+        "player_2_goals": [0],
+        "shots_for": [3],
+        "shots_against": [9],
+        "home_or_away": ["H"],
+        "date": ["2025-08-03"],
+    })
 
     # ---------- Act ----------
     s = build_summary(df)
-    row = s["opponents"].loc[s["opponents"]["opponent"]=="Luigi"].iloc[0]
+    row = s["opponents"].set_index("opponent").loc["Luigi"]
     # no NaN/Inf; both should be 0.0
 
     # ---------- Assert ----------
@@ -72,7 +91,11 @@ def test_goal_share_handles_zero_division():
     assert float(row["p2_goal_pct"]) == 0.0
 
 
-@pytest.fixture
+# Low-cardinality text columns are categorical in the cleaned data; fixtures match.
+_CATEGORY_DTYPES = {c: "category" for c in ("result", "opponent", "map", "home_or_away", "phase")}
+
+
+@pytest.fixture(scope="session")
 def df_small():
     """Small fixture: 4 matches across two opponents/maps/tournaments and phases.
 
@@ -82,54 +105,56 @@ def df_small():
       - 2 home, 2 away
     """
 
-    return pd.DataFrame([
-        # vs Mario (Underground), tourney 1
-        {"result":"W","opponent":"Mario","map":"Underground","tournament_no":1,
-         "goals_for":3,"goals_against":1,"player_1_goals":2,"player_2_goals":1,
-         "shots_for":9,"shots_against":6,"home_or_away":"H","date":"2025-08-01","phase":"Group"},
-        {"result":"L","opponent":"Mario","map":"Underground","tournament_no":1,
-         "goals_for":0,"goals_against":2,"player_1_goals":0,"player_2_goals":0,
-         "shots_for":5,"shots_against":8,"home_or_away":"A","date":"2025-08-02","phase":"Group"},
-        # vs Luigi (Battle Dome), tourney 2
-        {"result":"W","opponent":"Luigi","map":"Battle Dome","tournament_no":2,
-         "goals_for":2,"goals_against":0,"player_1_goals":1,"player_2_goals":1,
-         "shots_for":7,"shots_against":4,"home_or_away":"H","date":"2025-08-03","phase":"Knockout"},
-        {"result":"L","opponent":"Luigi","map":"Battle Dome","tournament_no":2,
-         "goals_for":1,"goals_against":2,"player_1_goals":1,"player_2_goals":0,
-         "shots_for":6,"shots_against":7,"home_or_away":"A","date":"2025-08-04","phase":"Knockout"},
-    ])
-
-
-def test_overall_kpis(df_small):
+    # Rows 0-1: vs Mario (Underground), tourney 1; rows 2-3: vs Luigi (Battle Dome), tourney 2.
+    return pd.DataFrame({
+        "result": ["W", "L", "W", "L"],
+        "opponent": ["Mario", "Mario", "Luigi", "Luigi"],
+        "map": ["Underground", "Underground", "Battle Dome", "Battle Dome"],
+        "tournament_no": [1, 1, 2, 2],
+        "goals_for": [3, 0, 2, 1],
+        "goals_against": [1, 2, 0, 2],
+        "player_1_goals": [2, 0, 1, 1],
+        "player_2_goals": [1, 0, 1, 0],
+        "shots_for": [9, 5, 7, 6],
+        "shots_against": [6, 8, 4, 7],
+        "home_or_away": ["H", "A", "H", "A"],
+        "date": pd.to_datetime(["2025-08-01", "2025-08-02", "2025-08-03", "2025-08-04"]),
+        "phase": ["Group", "Group", "Knockout", "Knockout"],
+    }).astype(_CATEGORY_DTYPES)
+
+
+@pytest.fixture(scope="session")
+def summary_small(df_small):
+    """`build_summary(df_small)`, computed once and shared (tests only read it)."""
+    return build_summary(df_small)
+
+
+# Section checks against `summary_small`; each takes the summary dict.
+
+def check_overall(summary):
     """Overall KPIs (games, wins/losses, GF/GA, diff, win%, GPG, goal share)."""
-    # ---------- Act ----------
-    sample_test = build_summary(df_small)
-    overall = sample_test["overall"]
+    overall = summary["overall"]
 
-    # ---------- Assert ----------
     assert overall["games"] == 4
     assert overall["wins"] == 2
     assert overall["losses"] == 2
     assert overall["goals_for"] == 6
     assert overall["goals_against"] == 5
     assert overall["goal_diff"] == 1
-    assert overall["win_pct"] == pytest.approx(0.5, 1e-9)
-    assert overall["goals_per_game"] == pytest.approx(1.50, 1e-9)
-    assert overall["player_1_goal_share_percentage"] == pytest.approx(66.67, abs=0.05)
-    assert overall["player_2_goal_share_percentage"] == pytest.approx(33.33, abs=0.05)
+    assert abs(overall["win_pct"] - 0.5) < 1e-9
+    assert abs(overall["goals_per_game"] - 1.50) < 1e-9
+    assert abs(overall["player_1_goal_share_percentage"] - 66.67) < 0.05
+    assert abs(overall["player_2_goal_share_percentage"] - 33.33) < 0.05
 
 
-def test_opponents_group_and_goal_share(df_small):
+def check_opponents(summary):
     """Opponent breakdown contains expected columns and sensible values."""
+    opp = summary["opponents"]
 
-    # ---------- Act ----------
-    sample_test = build_summary(df_small)
-    opp = sample_test["opponents"]
-
-    # ---------- Assert ----------
     assert not opp.empty
-    mario = opp.loc[opp["opponent"] == "Mario"].iloc[0]
-    luigi = opp.loc[opp["opponent"] == "Luigi"].iloc[0]
+    opp = opp.set_index("opponent")
+    mario = opp.loc["Mario"]
+    luigi = opp.loc["Luigi"]
 
     # Mario: 2 games, 1W/1L, GF=3, GA=3
     assert mario["games"] == 2
@@ -137,9 +162,9 @@ def test_opponents_group_and_goal_share(df_small):
     assert mario["losses"] == 1
     assert mario["goals_for"] == 3
     assert mario["goals_against"] == 3
-    assert mario["win_pct"] == pytest.approx(0.5, 1e-9)
-    assert mario["p1_goal_pct"] == pytest.approx(66.7, abs=0.05)
-    assert mario["p2_goal_pct"] == pytest.approx(33.3, abs=0.05)
+    assert abs(mario["win_pct"] - 0.5) < 1e-9
+    assert abs(mario["p1_goal_pct"] - 66.7) < 0.05
+    assert abs(mario["p2_goal_pct"] - 33.3) < 0.05
 
     # Luigi: 2 games, 1W/1L, GF=3, GA=2
     assert luigi["games"] == 2
@@ -147,40 +172,46 @@ def test_opponents_group_and_goal_share(df_small):
     assert luigi["losses"] == 1
     assert luigi["goals_for"] == 3
     assert luigi["goals_against"] == 2
-    assert luigi["p1_goal_pct"] == pytest.approx(66.7, abs=0.05)
-    assert luigi["p2_goal_pct"] == pytest.approx(33.3, abs=0.05)
+    assert abs(luigi["p1_goal_pct"] - 66.7) < 0.05
+    assert abs(luigi["p2_goal_pct"] - 33.3) < 0.05
 
 
-def test_phases_present_when_column_exists(df_small):
+def check_phases(summary):
     """Phase breakdown exists and includes both Group and Knockout."""
+    phases = summary["phases"]
 
-    # ---------- Act ---------- 
-    sample_test = build_summary(df_small)
-    phases = sample_test["phases"]
-
-    # ---------- Assert ----------
     assert not phases.empty
-    assert set(phases["phase"]) == {"Group", "Knockout"}
+    assert sorted(phases["phase"].unique().tolist()) == ["Group", "Knockout"]
 
 
-def test_maps_and_home_away_groups(df_small):
+def check_maps_home_away(summary):
     """Map and home/away breakdowns exist with expected columns/values."""
+    maps = summary["maps"]
+    ha = summary["home_away"]
 
-    # ---------- Act ---------- 
-    sample_test = build_summary(df_small)
-    maps = sample_test["maps"]
-    ha = sample_test["home_away"]
-
-    # ---------- Assert ----------
     assert not maps.empty and set(maps.columns) >= {
         "map","games","wins","losses","goals_for","goals_against","p1_goal_pct","p2_goal_pct"
     }
-    assert not ha.empty and set(ha["home_or_away"]) == {"H", "A"}
+    assert not ha.empty and sorted(ha["home_or_away"].unique().tolist()) == ["A", "H"]
     # 2 home + 2 away in our fixture
-    counts = ha.set_index("home_or_away")["games"].to_dict()
+    counts = dict(zip(ha["home_or_away"].to_numpy(), ha["games"].to_numpy()))
     assert counts["H"] == 2 and counts["A"] == 2
 
 
+CASES = [
+    ("overall", check_overall),
+    ("opponents", check_opponents),
+    ("phases", check_phases),
+    ("maps_home_away", check_maps_home_away),
+]
+
+
+@pytest.mark.parametrize("section,checker", CASES, ids=[section for section, _ in CASES])
+def test_summary_section(summary_small, section, checker):
+    """Each summary section of `df_small` matches the fixture (one shared `build_summary`)."""
+    checker(summary_small)
+
+
 def _toy_df():
     """Synthetic mini-dataset to exercise Stage-2 code paths.
 
@@ -188,6 +219,9 @@ def _toy_df():
     phases (Group + Knockout), and a pre-match probability column `p_win_pre`.
     This is intentionally small but varied so `build_summary` produces
     tournaments/phases groups, calibration blocks, and scouting output.
+    Dates are parsed and text keys categorical (as in the cleaned data);
+    goals, tournament numbers and probabilities use narrow dtypes, which the
+    aggregation must widen rather than overflow.
     """
     return pd.DataFrame(
         [
@@ -203,11 +237,33 @@ def _toy_df():
             "goals_for","goals_against","player_1_goals","player_2_goals",
             "tournament_no","phase","p_win_pre",
         ],
+    ).astype({
+        **_CATEGORY_DTYPES,
+        "date": "datetime64[ns]",
+        "goals_for": "int16", "goals_against": "int16", "tournament_no": "int8", "p_win_pre": "float32",
+    })
+
+
+@pytest.fixture(scope="session")
+def toy_df():
+    """Session-wide `_toy_df()` frame (tests only read it)."""
+    return _toy_df()
+
+
+@pytest.fixture(scope="session")
+def toy_summary(toy_df):
+    """Stage-2 summary of `toy_df`, computed once for the tests that inspect it."""
+    return build_summary(
+        toy_df,
+        per_tournament=True,
+        split_phase=True,
+        calibration_bins=5,
+        scout_recent=4,
     )
 
 
 @pytest.mark.filterwarnings("ignore:.*observed=False is deprecated.*:FutureWarning")
-def test_build_summary_includes_stage2_blocks():
+def test_build_summary_includes_stage2_blocks(toy_df, toy_summary):
     """Ensure `build_summary` returns all Stage-2 sections and sane values.
 
     Verifies:
@@ -218,17 +274,10 @@ def test_build_summary_includes_stage2_blocks():
       • Scouting list exists with rows containing expected keys.
     The warning filter silences a pandas future warning unrelated to behavior.
     """
-    df = _toy_df()
-    summary = build_summary(
-        df,
-        per_tournament=True,
-        split_phase=True,
-        calibration_bins=5,
-        scout_recent=4,
-    )
+    summary = toy_summary
 
     # Overall exists
-    assert summary["overall"]["games"] == len(df)
+    assert summary["overall"]["games"] == len(toy_df)
 
     # Grouped tables exist
     assert not summary["opponents"].empty
@@ -251,4 +300,96 @@ def test_build_summary_includes_stage2_blocks():
     assert {"opponent","n","wins","last_result","win_pct"}.issubset(scouting[0].keys())
 
 
+def test_build_summary_empty_frame():
+    """An empty match log yields zeroed KPIs and empty breakdowns without grouping."""
+
+    # ---------- Arrange ----------
+    df = _toy_df().iloc[:0]
+
+    # ---------- Act ----------
+    summary = build_summary(df)
+
+    # ---------- Assert ----------
+    assert summary["overall"]["games"] == 0
+    assert summary["overall"]["win_pct"] == 0.0
+    for key in ("opponents", "maps", "tournaments", "phases", "home_away"):
+        assert summary[key].empty
+    assert summary["calibration"]["brier"] is None
+    assert summary["scouting"] == []
+
+
+def test_build_summary_cached_reuses_and_invalidates(tmp_path, monkeypatch):
+    """Identical input is served from the cache; changed data is re-aggregated."""
+
+    # ---------- Arrange ----------
+    df = _toy_df()
+    calls = []
+    real_build = soccer.metrics.build_summary
+    monkeypatch.setattr(soccer.metrics, "build_summary", lambda *a, **k: calls.append(1) or real_build(*a, **k))
+
+    # ---------- Act ----------
+    first = build_summary_cached(df, tmp_path)
+    second = build_summary_cached(df.copy(), tmp_path)
+    changed = df.copy()
+    changed.loc[0, "goals_for"] = 9
+    third = build_summary_cached(changed, tmp_path)
+
+    # ---------- Assert ----------
+    assert len(calls) == 2  # first build + rebuild after the change; second was a cache hit
+    assert second["overall"] == first["overall"]
+    assert third["overall"]["goals_for"] == first["overall"]["goals_for"] + 6
+    assert len(list(tmp_path.glob("summary_*.pkl"))) == 1  # only the latest summary is kept
+
+
+def test_build_summary_cached_keys_on_code_and_normalized_dtypes(tmp_path, monkeypatch):
+    """A change to the metrics code misses the cache; a different datetime unit for the same dates does not."""
+
+    # ---------- Arrange ----------
+    df = _toy_df()
+    calls = []
+    real_build = soccer.metrics.build_summary
+    monkeypatch.setattr(soccer.metrics, "build_summary", lambda *a, **k: calls.append(1) or real_build(*a, **k))
+
+    # ---------- Act ----------
+    build_summary_cached(df, tmp_path)
+    build_summary_cached(df.astype({"date": "datetime64[ms]"}), tmp_path)
+    monkeypatch.setattr(soccer.metrics, "_code_stamp", lambda: b"edited")
+    build_summary_cached(df, tmp_path)
+
+    # ---------- Assert ----------
+    assert len(calls) == 2  # first build + rebuild after the code change
 
+
+def test_build_summary_compiled_rollups_match_bincount(monkeypatch):
+    """Forcing the Numba rollup kernel on (size threshold 0) yields the bincount tables exactly."""
+    pytest.importorskip("numba")
+
+    # ---------- Arrange ----------
+    df = _toy_df()
+    df.loc[1, "opponent"] = None  # a missing key must be skipped by both paths
+    expected = build_summary(df)
+
+    # ---------- Act ----------
+    monkeypatch.setattr(soccer.metrics, "_NUMBA_MIN_SIZE", 0)
+    summary = build_summary(df)
+
+    # ---------- Assert ----------
+    for key in ("opponents", "maps", "tournaments", "phases", "home_away"):
+        pd.testing.assert_frame_equal(summary[key], expected[key])
+
+
+def test_fallback_brier_numexpr_matches_numpy(monkeypatch):
+    """The numexpr Brier branch (forced on via its size threshold) agrees with the NumPy mean."""
+    pytest.importorskip("numexpr")
+
+    # ---------- Arrange ----------
+    df = _toy_df()
+    expected = soccer.metrics._fallback_brier_and_bins(df, bins=3)
+
+    # ---------- Act ----------
+    monkeypatch.setattr(soccer.metrics, "_NUMEXPR_MIN_SIZE", 0)
+    fb = soccer.metrics._fallback_brier_and_bins(df, bins=3)
+
+    # ---------- Assert ----------
+    assert fb["brier"] == expected["brier"]
+    assert fb["bins"] == expected["bins"]